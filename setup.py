@@ -53,6 +53,12 @@ INSTALLATION_REQUIREMENTS = [
     'PyJWT'
 ]
 
+EXTRA_REQUIREMENTS = {
+    'async': ['aiohttp'],
+    'http2': ['httpx[http2]>=0.26'],
+    'speedups': ['orjson'],
+}
+
 
 project_root = os.path.abspath(os.path.dirname(__file__))
 
@@ -92,4 +98,6 @@ setup(
     packages=find_packages(include=[PACKAGE_NAME, PACKAGE_NAME + '.*']),
 
     install_requires=INSTALLATION_REQUIREMENTS,
+
+    extras_require=EXTRA_REQUIREMENTS,
 )
@@ -0,0 +1,761 @@
+# -*- coding: utf-8 -*-
+"""WebexTeamsAPI Recording Report API fixtures and tests.
+
+Copyright (c) 2016-2020 Cisco and/or its affiliates.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import asyncio
+import concurrent.futures
+import json
+import threading
+import urllib.parse
+
+import pytest
+import requests
+
+import webexteamssdk
+import webexteamssdk.api.recording_report
+import webexteamssdk.models.dictionary
+from tests.local_server import LocalServer
+from webexteamssdk.api.recording_report import (
+    RecordingReportAPI, _CoverageCache,
+)
+from webexteamssdk.models.immutable import immutable_data_factory
+from webexteamssdk.models.mixins.recording import _parse_iso
+from webexteamssdk.restsession import RestSession
+
+
+BASE_URL = "https://webexapis.com/v1/"
+
+
+# Helper Functions
+def summary_response(url, page, pages):
+    """Build the response for page number `page` of an access summary."""
+    response = requests.Response()
+    response.status_code = 200
+    response.encoding = "utf-8"
+    response._content = json.dumps({
+        "items": [{"recordingId": "{}-{}".format(page, i)} for i in range(2)],
+    }).encode("utf-8")
+    if page + 1 < pages:
+        response.headers["Link"] = '<{}?page={}>; rel="next"'.format(
+            url, page + 1,
+        )
+    return response
+
+
+def stub_access_summary(monkeypatch, session, pages=2):
+    """Answer access summary requests with `pages` pages of two recordings.
+
+    Returns the list of the params sent with each first-page request.
+
+    """
+    requested = []
+
+    def request(method, url, erc, params=None, **kwargs):
+        query = urllib.parse.parse_qs(urllib.parse.urlparse(url).query)
+        page = int(query.get("page", [0])[0])
+        if page == 0:
+            requested.append(params)
+        return summary_response(session.abs_url(url), page, pages)
+
+    monkeypatch.setattr(session, "request", request)
+    return requested
+
+
+def json_response(json_data):
+    """Build a successful response with a JSON body."""
+    response = requests.Response()
+    response.status_code = 200
+    response.encoding = "utf-8"
+    response._content = json.dumps(json_data).encode("utf-8")
+    return response
+
+
+def stub_prefetch(monkeypatch, session, summary_ids, failing=(), release=None):
+    """Answer access summary and detail requests from stubbed recordings.
+
+    The access summary lists the `summary_ids` recordings.  Access detail
+    requests for recordings in `failing` raise a ValueError, and all of them
+    wait for the `release` event, if one is given.  The detail of a
+    recording has the number of times it was requested as its viewCount.
+    Returns the list of the params sent with each access detail request.
+
+    """
+    detail_requests = []
+    lock = threading.Lock()
+
+    def request(method, url, erc, params=None, **kwargs):
+        if not url.endswith("/accessDetail"):
+            return json_response({"items": [
+                {"recordingId": recording_id} for recording_id in summary_ids
+            ]})
+
+        recording_id = params["recordingId"]
+        with lock:
+            detail_requests.append(params)
+            view_count = sum(
+                1 for requested in detail_requests
+                if requested["recordingId"] == recording_id
+            )
+        if release is not None:
+            release.wait(timeout=5)
+        if recording_id in failing:
+            raise ValueError("{} failed".format(recording_id))
+        return json_response({
+            "recordingId": recording_id, "viewCount": view_count,
+        })
+
+    monkeypatch.setattr(session, "request", request)
+    return detail_requests
+
+
+def wait_for_prefetches(api):
+    """Wait for the in-flight access detail prefetches of api to finish."""
+    concurrent.futures.wait([
+        future for future, _ in list(api._prefetched_details.values())
+    ])
+
+
+def detail_handler(in_flight, failing=()):
+    """Build a local server handler answering access detail requests.
+
+    Later recordings are answered sooner, so that concurrent requests
+    complete out of order.  `in_flight` counts the requests being answered
+    ("now") and the most answered at once ("max").  Recordings in `failing`
+    are answered with a 404 error.
+
+    """
+    async def handler(request):
+        recording_id = request.query["recordingId"]
+        if recording_id in failing:
+            return 404, {"message": "Not found"}, {}
+
+        in_flight["now"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["now"])
+        try:
+            await asyncio.sleep(0.05 / (1 + int(recording_id)))
+        finally:
+            in_flight["now"] -= 1
+
+        return 200, {"recordingId": recording_id}, {}
+
+    return handler
+
+
+def summary_handler(pages):
+    """Build a local server handler answering access summary requests."""
+    async def handler(request):
+        page = int(request.query.get("page", 0))
+        response = summary_response(
+            str(request.url.with_query(None)), page, pages,
+        )
+        return 200, response.json(), response.headers
+
+    return handler
+
+
+def run_with_recording_report(base_url, backend, coroutine_function):
+    """Run coroutine_function(api) with an async RecordingReportAPI."""
+    session = RestSession(access_token="token", base_url=base_url)
+    api = RecordingReportAPI(
+        session, immutable_data_factory, async_backend=backend,
+    )
+
+    async def main():
+        try:
+            return await coroutine_function(api)
+        finally:
+            await api.aclose()
+
+    return asyncio.run(main())
+
+
+def day(number):
+    """The start of a day in January 2022."""
+    return _parse_iso("2022-01-{:02}T00:00:00.000Z".format(number))
+
+
+def recorded(recording_id, number):
+    """An access summary item recorded at noon on a day in January 2022."""
+    return {
+        "recordingId": recording_id,
+        "timeRecorded": "2022-01-{:02}T12:00:00.000Z".format(number),
+    }
+
+
+def recording_ids(items):
+    return [item["recordingId"] for item in items]
+
+
+# Fixtures
+@pytest.fixture(params=["aiohttp", "httpx"])
+def backend(request):
+    pytest.importorskip(request.param)
+    return request.param
+
+
+@pytest.fixture
+def session():
+    return RestSession(access_token="token", base_url=BASE_URL)
+
+
+@pytest.fixture
+def recording_report(session):
+    api = RecordingReportAPI(session, immutable_data_factory)
+    yield api
+    api.close()
+
+
+# Tests
+def test_recording_datetimes_are_parsed_when_read():
+    recording = webexteamssdk.Recording({
+        "id": "recording",
+        "createTime": "not a date",
+        "timeRecorded": "2022-01-01T10:00:00.000Z",
+    })
+
+    assert recording.id == "recording"
+    assert recording.timeRecorded == webexteamssdk.WebexTeamsDateTime(
+        2022, 1, 1, 10, tzinfo=webexteamssdk.utils.ZuluTimeZone(),
+    )
+    assert recording.timeRecorded is recording.timeRecorded
+    with pytest.raises(ValueError):
+        recording.createTime
+
+
+def test_recording_report_datetimes_are_parsed_when_read():
+    report = webexteamssdk.RecordingReport({
+        "recordingId": "recording",
+        "accessTime": "not a date",
+    })
+
+    assert report.recordingId == "recording"
+    assert report.timeRecorded is None
+    with pytest.raises(ValueError):
+        report.accessTime
+
+
+def test_access_summary_reuses_first_page_per_container(
+    monkeypatch, session, recording_report,
+):
+    requested = stub_access_summary(monkeypatch, session)
+
+    summary = recording_report.access_summary()
+    assert len(list(summary)) == 4
+    assert len(list(summary)) == 4
+    assert len(requested) == 1
+
+    # Separate calls, e.g. a polling loop, always request fresh data
+    list(recording_report.access_summary())
+    assert len(requested) == 2
+
+    list(recording_report.access_summary(cache_ttl=None))
+    uncached = recording_report.access_summary(cache_ttl=None)
+    list(uncached)
+    list(uncached)
+    assert len(requested) == 5
+
+
+def test_coverage_cache_gaps_around_cached_windows():
+    cache = _CoverageCache()
+    key = ("all", None)
+
+    assert cache.gaps(key, day(1), day(10)) == [(day(1), day(10))]
+
+    assert cache.add(key, day(3), day(5), [recorded("a", 3)])
+    assert cache.add(key, day(7), day(8), [recorded("b", 7)])
+
+    assert cache.gaps(key, day(1), day(10)) == [
+        (day(1), day(3)), (day(5), day(7)), (day(8), day(10)),
+    ]
+    assert cache.gaps(key, day(3), day(5)) == []
+    assert cache.gaps(key, day(4), day(6)) == [(day(5), day(6))]
+    assert cache.gaps(("other", None), day(3), day(5)) == [(day(3), day(5))]
+
+
+def test_coverage_cache_merges_overlapping_and_touching_windows():
+    cache = _CoverageCache()
+    key = ("all", None)
+
+    cache.add(key, day(3), day(5), [recorded("a", 3)])
+    cache.add(key, day(4), day(7), [recorded("b", 6)])  # Overlapping
+    cache.add(key, day(7), day(8), [recorded("c", 7)])  # Touching
+    cache.add(key, day(10), day(12), [recorded("d", 10)])  # Separate
+
+    windows = cache._windows[key]
+    assert [(w[0], w[1]) for w in windows] == [
+        (day(3), day(8)), (day(10), day(12)),
+    ]
+    assert sorted(windows[0][2]) == ["a", "b", "c"]
+    assert cache.gaps(key, day(3), day(12)) == [(day(8), day(10))]
+
+
+def test_coverage_cache_items_are_filtered_by_window():
+    cache = _CoverageCache()
+    key = ("all", None)
+    cache.add(key, day(1), day(10), [
+        recorded("a", 2), recorded("b", 5), recorded("c", 8),
+    ])
+
+    assert recording_ids(cache.items(key, day(1), day(10))) == ["c", "b", "a"]
+    assert recording_ids(cache.items(key, day(3), day(8))) == ["b"]
+    assert cache.items(key, day(5), day(11)) is None
+
+
+def test_coverage_cache_needs_recording_times():
+    cache = _CoverageCache()
+    key = ("all", None)
+
+    assert not cache.add(key, day(1), day(2), [{"recordingId": "a"}])
+    assert cache.gaps(key, day(1), day(2)) == [(day(1), day(2))]
+
+
+def test_coverage_cache_needs_parseable_recording_times():
+    cache = _CoverageCache()
+    key = ("all", None)
+
+    assert not cache.add(key, day(1), day(2), [
+        recorded("a", 1), {"recordingId": "b", "timeRecorded": "not a date"},
+    ])
+    assert cache.gaps(key, day(1), day(2)) == [(day(1), day(2))]
+
+
+def test_coverage_cache_items_are_copies():
+    cache = _CoverageCache()
+    key = ("all", None)
+    cache.add(key, day(1), day(2), [recorded("a", 1)])
+
+    cache.items(key, day(1), day(2))[0]["viewCount"] = 999
+
+    assert cache.items(key, day(1), day(2)) == [recorded("a", 1)]
+
+
+def test_coverage_cache_caps_items_per_query():
+    cache = _CoverageCache(max_items=3)
+    key = ("all", None)
+
+    cache.add(key, day(1), day(2), [recorded("a", 1), recorded("b", 1)])
+    cache.add(key, day(5), day(6), [recorded("c", 5), recorded("d", 5)])
+
+    # The least recently fetched window is evicted
+    assert cache.gaps(key, day(1), day(6)) == [(day(1), day(5))]
+
+    # A window with more items than the cap isn't cached at all
+    assert not cache.add(key, day(8), day(9), [
+        recorded(str(i), 8) for i in range(4)
+    ])
+    assert cache.gaps(key, day(8), day(9)) == [(day(8), day(9))]
+    assert cache.gaps(key, day(5), day(6)) == []
+
+
+def test_coverage_cache_windows_expire(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(
+        webexteamssdk.api.recording_report.time, "monotonic", lambda: now[0],
+    )
+    cache = _CoverageCache(ttl=60)
+    key = ("all", None)
+
+    cache.add(key, day(1), day(2), [recorded("a", 1)])
+    now[0] += 30
+    cache.add(key, day(5), day(6), [recorded("b", 5)])
+    now[0] += 30
+
+    assert cache.gaps(key, day(1), day(6)) == [(day(1), day(5))]
+    assert cache.items(key, day(5), day(6)) == [recorded("b", 5)]
+
+    now[0] += 30
+    assert cache.gaps(key, day(1), day(6)) == [(day(1), day(6))]
+    assert key not in cache._windows
+
+
+def test_cached_access_summary_requests_only_gaps(
+    monkeypatch, session, recording_report,
+):
+    requested = []
+
+    def request(method, url, erc, params=None, **kwargs):
+        requested.append((params["from"], params["to"]))
+        response = requests.Response()
+        response.status_code = 200
+        response.encoding = "utf-8"
+        response._content = json.dumps({"items": [
+            recorded("recorded-{}".format(number), number)
+            for number in range(1, 31)
+            if day(number) >= _parse_iso(params["from"])
+            and day(number) < _parse_iso(params["to"])
+        ]}).encode("utf-8")
+        return response
+
+    monkeypatch.setattr(session, "request", request)
+
+    def summary(start, end):
+        recordings = recording_report.access_summary(
+            _from=str(day(start)), to=str(day(end)), cached=True,
+        )
+        return [recording.recordingId for recording in recordings]
+
+    assert summary(10, 12) == ["recorded-11", "recorded-10"]
+    assert summary(8, 14) == [
+        "recorded-13", "recorded-12", "recorded-11", "recorded-10",
+        "recorded-9", "recorded-8",
+    ]
+    assert summary(9, 11) == ["recorded-10", "recorded-9"]
+    assert requested == [
+        (str(day(10)), str(day(12))),
+        (str(day(8)), str(day(10))),
+        (str(day(12)), str(day(14))),
+    ]
+
+
+def test_cached_access_summary_with_malformed_times(
+    monkeypatch, session, recording_report,
+):
+    items = [
+        recorded("a", 1), {"recordingId": "b", "timeRecorded": "not a date"},
+    ]
+    requested = []
+
+    def request(method, url, erc, params=None, **kwargs):
+        requested.append(params)
+        response = requests.Response()
+        response.status_code = 200
+        response.encoding = "utf-8"
+        response._content = json.dumps({"items": items}).encode("utf-8")
+        return response
+
+    monkeypatch.setattr(session, "request", request)
+
+    for cached in (False, True):
+        recordings = recording_report.access_summary(
+            _from=str(day(1)), to=str(day(2)), cached=cached,
+        )
+        assert [recording.recordingId for recording in recordings] == [
+            "a", "b",
+        ]
+
+    # The uncacheable items are requested again, without using the cache
+    assert len(requested) == 3
+
+
+def test_cached_access_summary_items_are_copies(monkeypatch, session):
+    api = RecordingReportAPI(
+        session, webexteamssdk.models.dictionary.dict_data_factory,
+    )
+    items = [recorded("a", 1)]
+
+    def request(method, url, erc, params=None, **kwargs):
+        response = requests.Response()
+        response.status_code = 200
+        response.encoding = "utf-8"
+        response._content = json.dumps({"items": items}).encode("utf-8")
+        return response
+
+    monkeypatch.setattr(session, "request", request)
+
+    def summary():
+        return list(api.access_summary(
+            _from=str(day(1)), to=str(day(2)), cached=True,
+        ))
+
+    summary()[0]["viewCount"] = 999
+    assert "viewCount" not in summary()[0]
+
+
+def test_access_summary_sends_request_parameters_flat(
+    monkeypatch, session, recording_report,
+):
+    requested = stub_access_summary(monkeypatch, session)
+
+    list(recording_report.access_summary(siteUrl="site", extra="value"))
+
+    assert requested == [
+        {"extra": "value", "hostEmail": "all", "siteUrl": "site"},
+    ]
+
+
+def test_access_summary_slicing_sets_max(
+    monkeypatch, session, recording_report,
+):
+    requested = stub_access_summary(monkeypatch, session)
+
+    recordings = list(recording_report.access_summary()[:3])
+    assert [recording.recordingId for recording in recordings] == [
+        "0-0", "0-1", "1-0",
+    ]
+    assert requested[-1]["max"] == 3
+
+    # An explicit max takes precedence over the slice
+    list(recording_report.access_summary(max=1)[:3])
+    assert requested[-1]["max"] == 1
+
+
+def test_access_summary_async_follows_link_headers(backend):
+    async def access_summary(api):
+        return [
+            recording.recordingId
+            async for recording in api.access_summary_async()
+        ]
+
+    with LocalServer({
+        "recordingReport/accessSummary": summary_handler(3),
+    }) as base_url:
+        recordings = run_with_recording_report(
+            base_url, backend, access_summary,
+        )
+
+    assert recordings == ["0-0", "0-1", "1-0", "1-1", "2-0", "2-1"]
+
+
+def test_access_detail_async(backend):
+    in_flight = {"now": 0, "max": 0}
+
+    async def access_detail(api):
+        return await api.access_detail_async("3")
+
+    with LocalServer({
+        "recordingReport/accessDetail": detail_handler(in_flight),
+    }) as base_url:
+        detail = run_with_recording_report(base_url, backend, access_detail)
+
+    assert isinstance(detail, webexteamssdk.RecordingReport)
+    assert detail.recordingId == "3"
+
+
+def test_access_details_bulk_keeps_input_order(backend):
+    in_flight = {"now": 0, "max": 0}
+    ids = [str(number) for number in range(8)]
+
+    async def access_details(api):
+        return await api.access_details_bulk(ids, concurrency=3)
+
+    with LocalServer({
+        "recordingReport/accessDetail": detail_handler(in_flight),
+    }) as base_url:
+        details = run_with_recording_report(base_url, backend, access_details)
+
+    assert [detail.recordingId for detail in details] == ids
+    assert in_flight["max"] == 3
+
+
+def test_access_details_bulk_raises_api_error(backend):
+    in_flight = {"now": 0, "max": 0}
+
+    async def access_details(api):
+        return await api.access_details_bulk(["1", "2", "3"])
+
+    with LocalServer({
+        "recordingReport/accessDetail": detail_handler(
+            in_flight, failing={"2"},
+        ),
+    }) as base_url:
+        with pytest.raises(webexteamssdk.ApiError) as exc_info:
+            run_with_recording_report(base_url, backend, access_details)
+
+    assert exc_info.value.status_code == 404
+    assert exc_info.value.message == "Not found"
+
+
+@pytest.mark.parametrize("concurrency", [0, -1])
+def test_access_details_bulk_needs_positive_concurrency(
+    recording_report, concurrency,
+):
+    with pytest.raises(ValueError):
+        asyncio.run(
+            recording_report.access_details_bulk(
+                ["1"], concurrency=concurrency,
+            )
+        )
+
+
+def test_access_details_keeps_input_order(backend):
+    in_flight = {"now": 0, "max": 0}
+    ids = [str(number) for number in range(8)]
+
+    with LocalServer({
+        "recordingReport/accessDetail": detail_handler(in_flight),
+    }) as base_url:
+        api = RecordingReportAPI(
+            RestSession(access_token="token", base_url=base_url),
+            immutable_data_factory,
+            async_backend=backend,
+        )
+        try:
+            details = api.access_details(ids, concurrency=3)
+        finally:
+            api.close()
+
+    assert [detail.recordingId for detail in details] == ids
+    assert in_flight["max"] == 3
+
+
+def test_access_details_works_inside_a_running_event_loop():
+    in_flight = {"now": 0, "max": 0}
+
+    async def main(api):
+        return api.access_details(["1", "2"])
+
+    with LocalServer({
+        "recordingReport/accessDetail": detail_handler(in_flight),
+    }) as base_url:
+        api = RecordingReportAPI(
+            RestSession(access_token="token", base_url=base_url),
+            immutable_data_factory,
+        )
+        try:
+            details = asyncio.run(main(api))
+        finally:
+            api.close()
+
+    assert [detail.recordingId for detail in details] == ["1", "2"]
+
+
+def test_close_stops_the_background_event_loop():
+    in_flight = {"now": 0, "max": 0}
+
+    with LocalServer({
+        "recordingReport/accessDetail": detail_handler(in_flight),
+    }) as base_url:
+        api = RecordingReportAPI(
+            RestSession(access_token="token", base_url=base_url),
+            immutable_data_factory,
+        )
+        api.access_details(["1"])
+        loop, thread = api._loop, api._loop_thread
+        assert thread.is_alive()
+
+        api.close()
+        assert not thread.is_alive()
+        assert loop.is_closed()
+        assert api._loop is None
+
+        # A later call starts a new event loop
+        try:
+            details = api.access_details(["2"])
+            assert api._loop is not loop
+            assert api._loop_thread.is_alive()
+        finally:
+            api.close()
+
+    assert [detail.recordingId for detail in details] == ["2"]
+
+
+def test_access_detail_uses_the_prefetched_detail(
+    monkeypatch, session, recording_report,
+):
+    detail_requests = stub_prefetch(monkeypatch, session, ["a", "b"])
+
+    list(recording_report.access_summary(prefetch_detail=True))
+    wait_for_prefetches(recording_report)
+    assert len(detail_requests) == 2
+
+    detail = recording_report.access_detail("a")
+    assert detail.recordingId == "a"
+    assert len(detail_requests) == 2
+
+    # A prefetched detail is only used once
+    assert recording_report.access_detail("a").viewCount == 2
+    assert len(detail_requests) == 3
+
+
+def test_failed_prefetch_is_requested_again(
+    monkeypatch, session, recording_report,
+):
+    detail_requests = stub_prefetch(
+        monkeypatch, session, ["a"], failing={"a"},
+    )
+
+    list(recording_report.access_summary(prefetch_detail=True))
+    wait_for_prefetches(recording_report)
+
+    with pytest.raises(ValueError, match="a failed"):
+        recording_report.access_detail("a")
+    assert len(detail_requests) == 2
+
+
+def test_access_detail_arguments_bypass_the_prefetch(
+    monkeypatch, session, recording_report,
+):
+    detail_requests = stub_prefetch(monkeypatch, session, ["a", "b"])
+
+    list(recording_report.access_summary(prefetch_detail=True))
+    wait_for_prefetches(recording_report)
+
+    recording_report.access_detail("a", max=5)
+    recording_report.access_detail("b", hostEmail="host@example.com")
+    assert detail_requests[2:] == [
+        {"max": 5, "recordingId": "a"},
+        {"recordingId": "b", "hostEmail": "host@example.com"},
+    ]
+
+    # The prefetched details are still used by plain calls
+    recording_report.access_detail("a")
+    recording_report.access_detail("b")
+    assert len(detail_requests) == 4
+
+
+def test_prefetches_in_flight_are_capped(
+    monkeypatch, session, recording_report,
+):
+    cap = webexteamssdk.api.recording_report.DETAIL_PREFETCH_MAX_IN_FLIGHT
+    release = threading.Event()
+    detail_requests = stub_prefetch(
+        monkeypatch, session, [str(i) for i in range(3 * cap)],
+        release=release,
+    )
+
+    try:
+        list(recording_report.access_summary(prefetch_detail=True))
+        assert len(recording_report._prefetched_details) == cap
+    finally:
+        release.set()
+
+    wait_for_prefetches(recording_report)
+    assert len(detail_requests) == cap
+
+
+def test_prefetched_details_expire(monkeypatch, session, recording_report):
+    now = [1000.0]
+    monkeypatch.setattr(
+        webexteamssdk.api.recording_report.time, "monotonic", lambda: now[0],
+    )
+    detail_requests = stub_prefetch(monkeypatch, session, ["a"])
+
+    list(recording_report.access_summary(prefetch_detail=True))
+    wait_for_prefetches(recording_report)
+    now[0] += webexteamssdk.api.recording_report.DETAIL_PREFETCH_TTL + 1
+
+    assert recording_report.access_detail("a").viewCount == 2
+    assert len(detail_requests) == 2
+
+
+def test_listing_again_replaces_the_prefetched_detail(
+    monkeypatch, session, recording_report,
+):
+    detail_requests = stub_prefetch(monkeypatch, session, ["a"])
+
+    for _ in range(2):
+        list(recording_report.access_summary(prefetch_detail=True))
+        wait_for_prefetches(recording_report)
+
+    assert recording_report.access_detail("a").viewCount == 2
+    assert len(detail_requests) == 2
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""Local HTTP server for offline tests of the asynchronous API methods.
+
+Copyright (c) 2016-2020 Cisco and/or its affiliates.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+try:
+    from aiohttp import web
+except ImportError:
+    web = None
+
+
+class LocalServer(object):
+    """An aiohttp.web server running on its own event loop and thread.
+
+    Answers GET requests for the API endpoint paths of `handlers` (e.g.
+    "items").  Each handler is a coroutine function which takes the
+    aiohttp.web.Request and returns its response as a (status, JSON body,
+    headers) tuple.  Used as a context manager, which returns the base URL
+    of the server.
+    The server runs on its own loop, so it keeps answering requests while
+    the loop of the code under test is blocked or being shut down.
+
+    """
+
+    def __init__(self, handlers):
+        if web is None:
+            pytest.skip("The local server requires the aiohttp package")
+
+        self._handlers = handlers
+        self._loop = None
+        self._thread = None
+        self._runner = None
+
+    @staticmethod
+    def _json_handler(handler):
+        async def json_handler(request):
+            status, body, headers = await handler(request)
+            return web.json_response(body, status=status, headers=headers)
+
+        return json_handler
+
+    async def _start(self):
+        app = web.Application()
+        for path, handler in self._handlers.items():
+            app.router.add_get("/v1/" + path, self._json_handler(handler))
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = self._runner.addresses[0][1]
+        return "http://127.0.0.1:{}/v1/".format(port)
+
+    def __enter__(self):
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="LocalServer", daemon=True,
+        )
+        self._thread.start()
+        return asyncio.run_coroutine_threadsafe(
+            self._start(), self._loop,
+        ).result()
+
+    def __exit__(self, *exc_info):
+        asyncio.run_coroutine_threadsafe(
+            self._runner.cleanup(), self._loop,
+        ).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
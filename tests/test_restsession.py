@@ -23,17 +23,29 @@ SOFTWARE.
 """
 
 
+import asyncio
+import json
 import logging
+import threading
+import urllib.parse
 import warnings
 
 import pytest
+import requests
 
 import webexteamssdk
+from tests.local_server import LocalServer
+from webexteamssdk.restsession import (
+    AsyncRestSession, FirstPageCache, RestSession,
+)
 
 
 logging.captureWarnings(True)
 
 
+BASE_URL = "https://webexapis.com/v1/"
+
+
 # Helper Functions
 def rate_limit_detected(w):
     """Check to see if a rate-limit warning is in the warnings list."""
@@ -43,6 +55,84 @@ def rate_limit_detected(w):
     return False
 
 
+def page_response(page, pages):
+    """Build the response for page number `page` of a `pages` pages query."""
+    response = requests.Response()
+    response.status_code = 200
+    response.encoding = "utf-8"
+    response._content = json.dumps({"items": [page]}).encode("utf-8")
+    if page + 1 < pages:
+        response.headers["Link"] = '<{}items?page={}>; rel="next"'.format(
+            BASE_URL, page + 1,
+        )
+    return response
+
+
+def stub_pages(monkeypatch, session, pages, fail_on=None):
+    """Answer the session's requests from a stubbed `pages` pages query.
+
+    The request for page number `fail_on` raises a ValueError.  Returns the
+    list of requested page numbers.
+
+    """
+    requested = []
+
+    def request(method, url, erc, **kwargs):
+        query = urllib.parse.parse_qs(urllib.parse.urlparse(url).query)
+        page = int(query.get("page", [0])[0])
+        requested.append(page)
+        if page == fail_on:
+            raise ValueError("page {} failed".format(page))
+        return page_response(page, pages)
+
+    monkeypatch.setattr(session, "request", request)
+    return requested
+
+
+def paged_handler(pages, requested):
+    """Build a local server handler answering a `pages` pages query.
+
+    The requested page numbers are appended to `requested`.
+
+    """
+    async def handler(request):
+        page = int(request.query.get("page", 0))
+        requested.append(page)
+        headers = {}
+        if page + 1 < pages:
+            headers["Link"] = '<{}?page={}>; rel="next"'.format(
+                request.url.with_query(None), page + 1,
+            )
+        return 200, {"items": [page]}, headers
+
+    return handler
+
+
+def run_with_async_session(base_url, backend, coroutine_function):
+    """Run coroutine_function(asession) with a new AsyncRestSession."""
+    session = RestSession(access_token="token", base_url=base_url)
+    asession = AsyncRestSession(session, backend=backend)
+
+    async def main():
+        try:
+            return await coroutine_function(asession)
+        finally:
+            await asession.aclose()
+
+    return asyncio.run(main())
+
+
+def async_client_closed(client):
+    """Check to see if an aiohttp or httpx client has been closed."""
+    return getattr(client, "is_closed", None) or getattr(client, "closed")
+
+
+# Fixtures
+@pytest.fixture
+def session():
+    return RestSession(access_token="token", base_url=BASE_URL)
+
+
 # Tests
 @pytest.mark.slow
 def test_rate_limit_retry(api, list_of_rooms, add_rooms):
@@ -59,3 +149,206 @@ def test_rate_limit_retry(api, list_of_rooms, add_rooms):
                 break
 
     api._session.wait_on_rate_limit = original_wait_on_rate_limit
+
+
+@pytest.mark.parametrize("backend", ["aiohttp", "httpx"])
+def test_async_client_follows_event_loop(backend):
+    pytest.importorskip(backend)
+    session = webexteamssdk.restsession.RestSession(
+        access_token="token",
+        base_url="https://webexapis.com/v1/",
+    )
+    asession = webexteamssdk.restsession.AsyncRestSession(
+        session, backend=backend,
+    )
+
+    first = asyncio.run(asession._get_client())
+    second = asyncio.run(asession._get_client())
+
+    assert first is not second
+    assert async_client_closed(first)
+
+    async def reuse():
+        client = await asession._get_client()
+        assert await asession._get_client() is client
+        await asession.aclose()
+        return client
+
+    client = asyncio.run(reuse())
+    assert asession._client is None
+    assert async_client_closed(client)
+
+
+def test_get_items_without_page_cache(monkeypatch, session):
+    requested = stub_pages(monkeypatch, session, 3)
+
+    assert list(session.get_items("items")) == [0, 1, 2]
+    assert list(session.get_items("items")) == [0, 1, 2]
+    assert requested == [0, 1, 2, 0, 1, 2]
+
+
+def test_first_page_cache_reuses_the_first_page(monkeypatch, session):
+    requested = stub_pages(monkeypatch, session, 3)
+    page_cache = FirstPageCache(ttl=60)
+
+    assert list(session.get_items("items", page_cache=page_cache)) == [0, 1, 2]
+    assert list(session.get_items("items", page_cache=page_cache)) == [0, 1, 2]
+    assert requested == [0, 1, 2, 1, 2]
+
+
+def test_first_page_cache_expires(monkeypatch, session):
+    requested = stub_pages(monkeypatch, session, 1)
+    page_cache = FirstPageCache(ttl=5)
+    now = [1000.0]
+    monkeypatch.setattr(
+        webexteamssdk.restsession.time, "monotonic", lambda: now[0],
+    )
+
+    list(session.get_items("items", page_cache=page_cache))
+    now[0] += 4
+    list(session.get_items("items", page_cache=page_cache))
+    assert requested == [0]
+
+    now[0] += 1
+    list(session.get_items("items", page_cache=page_cache))
+    assert requested == [0, 0]
+
+
+def test_first_page_cache_evicts_the_oldest_pages(monkeypatch, session):
+    requested = stub_pages(monkeypatch, session, 1)
+    page_cache = FirstPageCache(ttl=60, max_entries=2)
+
+    for query in ("a", "b", "c", "b", "c"):
+        list(session.get_items(
+            "items", params={"q": query}, page_cache=page_cache,
+        ))
+    assert len(requested) == 3
+
+    list(session.get_items("items", params={"q": "a"}, page_cache=page_cache))
+    assert len(requested) == 4
+
+
+def test_prefetched_pages_are_requested_by_a_producer_thread(
+    monkeypatch, session,
+):
+    requested = stub_pages(monkeypatch, session, 5)
+    stubbed_request = session.request
+    threads = []
+
+    def request(*args, **kwargs):
+        threads.append(threading.current_thread().name)
+        return stubbed_request(*args, **kwargs)
+
+    monkeypatch.setattr(session, "request", request)
+
+    assert list(session.get_items("items", prefetch=2)) == [0, 1, 2, 3, 4]
+    assert requested == [0, 1, 2, 3, 4]
+    assert threads[0] == threading.current_thread().name
+    assert set(threads[1:]) == {"RestSession-page-prefetch"}
+
+
+def test_prefetch_errors_are_raised_in_the_consumer(monkeypatch, session):
+    stub_pages(monkeypatch, session, 5, fail_on=2)
+    items = session.get_items("items", prefetch=True)
+
+    assert next(items) == 0
+    assert next(items) == 1
+    with pytest.raises(ValueError, match="page 2 failed"):
+        next(items)
+
+
+def test_prefetch_stops_when_the_consumer_stops(monkeypatch, session):
+    requested = stub_pages(monkeypatch, session, 100)
+    running = set(threading.enumerate())
+    pages = session.get_pages("items", prefetch=1)
+
+    assert next(pages) == {"items": [0]}
+    producers = [
+        thread for thread in threading.enumerate()
+        if thread.name == "RestSession-page-prefetch"
+        and thread not in running
+    ]
+    assert len(producers) == 1
+
+    pages.close()
+    producers[0].join(timeout=5)
+
+    assert not producers[0].is_alive()
+    assert len(requested) < 100
+
+
+@pytest.mark.parametrize("prefetch", [-1, 1.5, None])
+def test_prefetch_must_be_a_non_negative_integer(session, prefetch):
+    with pytest.raises((TypeError, ValueError)):
+        next(session.get_pages("items", prefetch=prefetch))
+
+
+@pytest.mark.parametrize("backend", ["aiohttp", "httpx"])
+def test_async_get_items_follows_link_headers(backend):
+    pytest.importorskip(backend)
+    requested = []
+
+    async def get_items(asession):
+        return [item async for item in asession.get_items("items")]
+
+    with LocalServer({"items": paged_handler(3, requested)}) as base_url:
+        items = run_with_async_session(base_url, backend, get_items)
+
+    assert items == [0, 1, 2]
+    assert requested == [0, 1, 2]
+
+
+@pytest.mark.parametrize("backend", ["aiohttp", "httpx"])
+def test_async_get_pages_sends_params_with_the_first_request(backend):
+    pytest.importorskip(backend)
+    queries = []
+
+    async def handler(request):
+        queries.append(dict(request.query))
+        return await paged_handler(2, [])(request)
+
+    async def get_pages(asession):
+        return [
+            page async for page in asession.get_pages(
+                "items", params={"max": 1},
+            )
+        ]
+
+    with LocalServer({"items": handler}) as base_url:
+        pages = run_with_async_session(base_url, backend, get_pages)
+
+    assert pages == [{"items": [0]}, {"items": [1]}]
+    assert queries == [{"max": "1"}, {"page": "1"}]
+
+
+@pytest.mark.parametrize("backend", ["aiohttp", "httpx"])
+def test_async_get_raises_api_error(backend):
+    pytest.importorskip(backend)
+
+    async def not_found(request):
+        return 404, {"message": "Not found", "trackingId": "tracking"}, {}
+
+    with LocalServer({"items": not_found}) as base_url:
+        with pytest.raises(webexteamssdk.ApiError) as exc_info:
+            run_with_async_session(
+                base_url, backend, lambda asession: asession.get("items"),
+            )
+
+    assert exc_info.value.status_code == 404
+    assert exc_info.value.message == "Not found"
+    assert exc_info.value.tracking_id == "tracking"
+
+
+@pytest.mark.parametrize("backend", ["aiohttp", "httpx"])
+def test_async_get_items_raises_malformed_response(backend):
+    pytest.importorskip(backend)
+
+    async def no_items(request):
+        return 200, {"results": []}, {}
+
+    async def get_items(asession):
+        return [item async for item in asession.get_items("items")]
+
+    with LocalServer({"items": no_items}) as base_url:
+        with pytest.raises(webexteamssdk.MalformedResponse):
+            run_with_async_session(base_url, backend, get_items)
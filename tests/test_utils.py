@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""webexteamssdk/utils.py Fixtures & Tests
+
+Copyright (c) 2016-2020 Cisco and/or its affiliates.
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+import pytest
+import requests
+
+import webexteamssdk.utils
+
+
+JSON_TEXT = '{"items": [{"id": "1", "nested": {"key": "value"}}]}'
+
+
+# Helper Functions
+def json_response(text):
+    """Build a requests.Response object with a JSON body."""
+    response = requests.Response()
+    response.status_code = 200
+    response.encoding = "utf-8"
+    response._content = text.encode("utf-8")
+    return response
+
+
+# Tests
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_objects_are_plain_dicts(monkeypatch, use_orjson):
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(webexteamssdk.utils, "orjson", None)
+
+    data = webexteamssdk.utils.extract_and_parse_json(json_response(JSON_TEXT))
+
+    assert type(data) is dict
+    assert type(data["items"][0]) is dict
+    assert type(data["items"][0]["nested"]) is dict
+    assert data == webexteamssdk.utils.json_dict(JSON_TEXT)
+    assert type(webexteamssdk.utils.json_dict(JSON_TEXT)) is dict
+
+
+def test_check_types_accepts_valid_objects():
+    webexteamssdk.utils.check_types(
+        ("string", str, False),
+        (None, str, True),
+        (5, (int, float), False),
+        (5.0, (int, float), True),
+    )
+
+
+@pytest.mark.parametrize("obj, acceptable_types, optional", [
+    (5, str, False),  # Wrong type
+    (5, str, True),  # Wrong type, optional
+    (None, int, False),  # None, not optional
+    ("5", (int, float), True),  # Wrong type, several acceptable types
+])
+def test_check_types_raises_like_check_type(obj, acceptable_types, optional):
+    with pytest.raises(TypeError) as check_type_error:
+        webexteamssdk.utils.check_type(obj, acceptable_types, optional)
+
+    with pytest.raises(TypeError) as check_types_error:
+        webexteamssdk.utils.check_types(
+            ("valid", str, False),
+            (obj, acceptable_types, optional),
+        )
+
+    assert str(check_types_error.value) == str(check_type_error.value)
+
+
+def test_check_types_accepts_bool_as_int_like_check_type():
+    # bool is a subclass of int, and check_type has always accepted it
+    assert webexteamssdk.utils.check_type(True, int)
+    webexteamssdk.utils.check_types((True, int, False), (False, int, True))
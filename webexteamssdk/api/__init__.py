@@ -27,6 +27,7 @@ import os
 from past.types import basestring
 
 from webexteamssdk.config import (
+    DEFAULT_ASYNC_BACKEND,
     DEFAULT_BASE_URL,
     DEFAULT_SINGLE_REQUEST_TIMEOUT,
     DEFAULT_WAIT_ON_RATE_LIMIT,
@@ -85,6 +86,7 @@ class WebexTeamsAPI(object):
         be_geo_id=None,
         caller=None,
         disable_ssl_verify=False,
+        async_backend=DEFAULT_ASYNC_BACKEND,
     ):
         """Create a new WebexTeamsAPI object.
 
@@ -138,6 +140,10 @@ class WebexTeamsAPI(object):
             disable_ssl_verify(bool): Optional boolean flag to disable ssl
                 verification. Defaults to False. If set to True, the requests
                 session won't verify ssl certs anymore.
+            async_backend(basestring): The HTTP client package used by the
+                asynchronous recording report methods, "aiohttp" or "httpx"
+                (HTTP/2). Defaults to
+                webexteamssdk.config.DEFAULT_ASYNC_BACKEND.
 
         Returns:
             WebexTeamsAPI: A new WebexTeamsAPI object.
@@ -160,6 +166,7 @@ class WebexTeamsAPI(object):
         check_type(be_geo_id, basestring, optional=True)
         check_type(caller, basestring, optional=True)
         check_type(disable_ssl_verify, bool, optional=True)
+        check_type(async_backend, basestring)
 
         access_token = access_token or WEBEX_TEAMS_ACCESS_TOKEN
 
@@ -233,7 +240,11 @@ class WebexTeamsAPI(object):
         )
         self.webhooks = WebhooksAPI(self._session, object_factory)
         self.recordings = RecordingsAPI(self._session, object_factory)
-        self.recording_report = RecordingReportAPI(self._session, object_factory)
+        self.recording_report = RecordingReportAPI(
+            self._session,
+            object_factory,
+            async_backend=async_backend,
+        )
         self.meetings = MeetingsAPI(self._session, object_factory)
         self.meeting_templates = MeetingTemplatesAPI(self._session, object_factory)
         self.meeting_invitees = MeetingInviteesAPI(self._session, object_factory)
@@ -28,17 +28,199 @@ from __future__ import (
     unicode_literals,
 )
 
-from builtins import *
-
-from past.builtins import basestring
+import asyncio
+import concurrent.futures
+import threading
+import time
+from collections import OrderedDict
 
+from webexteamssdk.config import DEFAULT_ASYNC_BACKEND, DEFAULT_PAGE_CACHE_TTL
 from webexteamssdk.generator_containers import generator_container
-from webexteamssdk.restsession import RestSession
-from webexteamssdk.utils import check_type, dict_from_items_with_values
+from webexteamssdk.models.mixins.recording import _parse_iso
+from webexteamssdk.restsession import (
+    AsyncRestSession,
+    FirstPageCache,
+    RestSession,
+)
+from webexteamssdk.utils import check_type, check_types
 
 API_ENDPOINT = "recordingReport"
 OBJECT_TYPE = "recording_report"
 
+COVERAGE_CACHE_MAX_QUERIES = 128
+
+COVERAGE_CACHE_MAX_ITEMS = 10000
+
+COVERAGE_CACHE_TTL = 300
+
+DETAIL_PREFETCH_WORKERS = 2
+
+DETAIL_PREFETCH_MAX_IN_FLIGHT = 8
+
+DETAIL_PREFETCH_MAX_RESULTS = 64
+
+DETAIL_PREFETCH_TTL = 5
+
+
+def _window_gaps(windows, start, end):
+    """Return the parts of the [start, end) window not covered by windows.
+
+    The windows must be sorted by their start time.
+
+    """
+    gaps = []
+    cursor = start
+    for window_start, window_end, _, _ in windows:
+        if window_end <= cursor:
+            continue
+        if window_start >= end:
+            break
+        if window_start > cursor:
+            gaps.append((cursor, window_start))
+        cursor = max(cursor, window_end)
+
+    if cursor < end:
+        gaps.append((cursor, end))
+
+    return gaps
+
+
+class _CoverageCache(object):
+    """Cache of access summary items by the time windows they cover.
+
+    For each (hostEmail, siteUrl) query key, stores the [from, to) windows
+    that have been fetched together with the items returned for them, so a
+    later query can be answered locally for the covered part of its window.
+    The number of query keys is LRU-bounded, each key keeps at most
+    `max_items` items (evicting its least recently fetched windows first),
+    and windows expire `ttl` seconds after they were first fetched.
+
+    """
+
+    def __init__(
+        self,
+        max_queries=COVERAGE_CACHE_MAX_QUERIES,
+        max_items=COVERAGE_CACHE_MAX_ITEMS,
+        ttl=COVERAGE_CACHE_TTL,
+    ):
+        self._max_queries = max_queries
+        self._max_items = max_items
+        self._ttl = ttl
+        self._windows = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _live_windows(self, key):
+        """Return the unexpired windows of key, dropping the expired ones.
+
+        Must be called with the lock held.
+
+        """
+        windows = self._windows.get(key)
+        if not windows:
+            return []
+
+        expired_before = time.monotonic() - self._ttl
+        live = [window for window in windows if window[3] > expired_before]
+        if len(live) < len(windows):
+            if live:
+                self._windows[key] = live
+            else:
+                del self._windows[key]
+
+        return live
+
+    def gaps(self, key, start, end):
+        """Return the parts of the [start, end) window that aren't cached."""
+        with self._lock:
+            return _window_gaps(self._live_windows(key), start, end)
+
+    def add(self, key, start, end, items):
+        """Store the items fetched for the [start, end) window.
+
+        Returns:
+            bool: False, storing nothing, if an item has no parseable
+            `timeRecorded` time to filter it by, or if the window (merged with
+            the cached windows it overlaps or touches) holds more than
+            `max_items` items.
+
+        """
+        timed_items = {}
+        for item in items:
+            recorded = item.get("timeRecorded")
+            if not recorded:
+                return False
+            try:
+                recorded = _parse_iso(recorded)
+            except ValueError:
+                return False
+            timed_items[item.get("recordingId")] = (recorded, item)
+
+        if len(timed_items) > self._max_items:
+            return False
+
+        with self._lock:
+            windows = self._live_windows(key)
+            self._windows.pop(key, None)
+            fetched_at = time.monotonic()
+
+            # Merge the new window with the windows it overlaps or touches
+            others = []
+            for window in windows:
+                window_start, window_end, window_items, window_time = window
+                if window_end < start or window_start > end:
+                    others.append(window)
+                else:
+                    start = min(start, window_start)
+                    end = max(end, window_end)
+                    window_items.update(timed_items)
+                    timed_items = window_items
+                    fetched_at = min(fetched_at, window_time)
+
+            if len(timed_items) > self._max_items:
+                if others:
+                    self._windows[key] = others
+                return False
+
+            # Evict the least recently fetched windows beyond max_items
+            others.sort(key=lambda window: window[3])
+            total = len(timed_items) + sum(len(window[2]) for window in others)
+            while total > self._max_items:
+                total -= len(others.pop(0)[2])
+
+            others.append((start, end, timed_items, fetched_at))
+            others.sort(key=lambda window: window[0])
+            self._windows[key] = others
+
+            while len(self._windows) > self._max_queries:
+                self._windows.popitem(last=False)
+
+            return True
+
+    def items(self, key, start, end):
+        """Return the cached items recorded in [start, end), newest first.
+
+        The items are copies, so changes made by the caller don't reach the
+        cache.  Returns None if the [start, end) window isn't completely
+        cached.
+
+        """
+        with self._lock:
+            windows = self._live_windows(key)
+            if _window_gaps(windows, start, end):
+                return None
+            self._windows.move_to_end(key)
+
+            timed_items = [
+                timed_item
+                for window_start, window_end, window_items, _ in windows
+                if window_start < end and window_end > start
+                for timed_item in window_items.values()
+                if start <= timed_item[0] < end
+            ]
+
+        timed_items.sort(key=lambda timed_item: timed_item[0], reverse=True)
+        return [dict(item) for _, item in timed_items]
+
 
 class RecordingReportAPI(object):
     """Webex Teams Recording report API.
@@ -48,23 +230,150 @@ class RecordingReportAPI(object):
 
     """
 
-    def __init__(self, session, object_factory):
+    def __init__(
+        self, session, object_factory, async_backend=DEFAULT_ASYNC_BACKEND
+    ):
         """Init a new RecordingReportAPI object with the provided RestSession.
 
         Args:
             session(RestSession): The RESTful session object to be used for
                 API calls to the Webex Teams service.
+            async_backend(str): The HTTP client package used by the
+                asynchronous and bulk methods, "aiohttp" or "httpx".  The
+                "httpx" backend multiplexes concurrent requests over HTTP/2.
 
         Raises:
             TypeError: If the parameter types are incorrect.
+            ValueError: If `async_backend` is not a supported backend.
 
         """
         check_type(session, RestSession)
         super(RecordingReportAPI, self).__init__()
         self._session = session
+        self._async_backend = async_backend
+        self._asession = AsyncRestSession(session, backend=async_backend)
         self._object_factory = object_factory
+        self._coverage = _CoverageCache()
+
+        # Speculative access detail requests made while listing summaries,
+        # as (future, time.monotonic() when requested) by recording ID
+        self._detail_executor = None
+        self._detail_slots = threading.BoundedSemaphore(
+            DETAIL_PREFETCH_MAX_IN_FLIGHT
+        )
+        self._prefetched_details = OrderedDict()
+        self._prefetch_lock = threading.Lock()
+
+        # Background event loop (and its own async session) used to run the
+        # asynchronous requests behind the synchronous bulk methods
+        self._loop = None
+        self._loop_thread = None
+        self._loop_asession = None
+        self._loop_lock = threading.Lock()
+
+    def close(self):
+        """Close the pooled connections and stop the background threads."""
+        with self._prefetch_lock:
+            if self._detail_executor is not None:
+                self._detail_executor.shutdown(wait=False)
+                self._detail_executor = None
+            self._prefetched_details.clear()
+
+        with self._loop_lock:
+            if self._loop is not None:
+                asyncio.run_coroutine_threadsafe(
+                    self._loop_asession.aclose(), self._loop
+                ).result()
+                self._loop.call_soon_threadsafe(self._loop.stop)
+                self._loop_thread.join()
+                self._loop.close()
+                self._loop = None
+                self._loop_thread = None
+                self._loop_asession = None
+
+        self._session.close()
+
+    async def aclose(self):
+        """Close the connections opened by the asynchronous API methods."""
+        await self._asession.aclose()
+
+    def _run_coroutine(self, coroutine):
+        """Run a coroutine on the background event loop and return its result.
+
+        The loop is started in a daemon thread on first use and keeps running,
+        with its async session and open connections, until :meth:`close`.
+
+        """
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._loop_asession = AsyncRestSession(
+                    self._session, backend=self._async_backend
+                )
+                self._loop_thread = threading.Thread(
+                    target=self._loop.run_forever,
+                    name="RecordingReportAPI-event-loop",
+                    daemon=True,
+                )
+                self._loop_thread.start()
+
+            future = asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+
+        return future.result()
+
+    def _access_summary_params(
+        self, max, _from, to, hostEmail, siteUrl, request_parameters
+    ):
+        """Check the access summary arguments and build the request params."""
+        check_types(
+            (max, int, True),
+            (_from, str, True),
+            (to, str, True),
+            (hostEmail, str, True),
+            (siteUrl, str, True),
+        )
+
+        params = {
+            key: value
+            for key, value in request_parameters.items()
+            if value is not None
+        }
+        if max is not None:
+            params["max"] = max
+        if _from is not None:
+            params["from"] = _from
+        if to is not None:
+            params["to"] = to
+        if hostEmail is not None:
+            params["hostEmail"] = hostEmail
+        if siteUrl is not None:
+            params["siteUrl"] = siteUrl
+
+        return params
+
+    def _access_detail_params(
+        self, recordingId, max, hostEmail, request_parameters
+    ):
+        """Check the access detail arguments and build the request params."""
+        check_types(
+            (max, int, True),
+            (recordingId, str, False),
+            (hostEmail, str, True),
+        )
+
+        params = {
+            key: value
+            for key, value in request_parameters.items()
+            if value is not None
+        }
+        if max is not None:
+            params["max"] = max
+        params["recordingId"] = recordingId
+        if hostEmail is not None:
+            params["hostEmail"] = hostEmail
+
+        return params
 
-    @generator_container
     def access_summary(
         self,
         max=None,
@@ -72,6 +381,10 @@ class RecordingReportAPI(object):
         to=None,
         hostEmail="all",
         siteUrl=None,
+        prefetch=False,
+        cached=False,
+        prefetch_detail=False,
+        cache_ttl=DEFAULT_PAGE_CACHE_TTL,
         **request_parameters,
     ):
         """Lists recording audit report summary.
@@ -88,17 +401,38 @@ class RecordingReportAPI(object):
         The container makes the generator safe for reuse.  A new API call will
         be made, using the same parameters that were specified when the
         generator was created, every time a new iterator is requested from the
-        container.
+        container.  New iterators of the same container reuse its first page
+        of responses, instead of requesting it again, for `cache_ttl` seconds;
+        separate calls to this method always request fresh data.
 
         Args:
             max(int): Limit the maximum number of items returned from the Webex
                 Teams service per request.
-            _from(basestring): List recording audit report which occurred after a specific
-                date and time.
-            to(basestring): List recording audit report which occurred before a specific date
-                and time.
-            hostEmail(basestring): Email address of meeting host. Default is "all".
-            siteUrl(basestring): URL of the Webex site which the API lists recordings from.
+            _from(str): List recording audit report which occurred after a
+                specific date and time.
+            to(str): List recording audit report which occurred before a
+                specific date and time.
+            hostEmail(str): Email address of meeting host. Default is "all".
+            siteUrl(str): URL of the Webex site which the API lists
+                recordings from.
+            prefetch(bool, int): The number of pages of recordings to request
+                ahead, in a background thread, while the current page is being
+                consumed.  True reads one page ahead.
+            cached(bool): Answer the query from the recordings cached by
+                earlier cached queries for the same hostEmail and siteUrl,
+                requesting only the parts of the `_from`/`to` window that
+                haven't been fetched yet.  Only used when both `_from` and
+                `to` are given and there are no additional request parameters.
+            prefetch_detail(bool): Request the access details of the listed
+                recordings in background threads, so that a following
+                :meth:`access_detail` call for one of them (without `max`,
+                `hostEmail` or additional parameters) returns without waiting
+                on the network.  Prefetched details are only used for a few
+                seconds, and prefetches are skipped while too many are already
+                in flight.
+            cache_ttl(int, float): The number of seconds for which the first
+                page of responses is reused by new iterators of the returned
+                container.  None requests it again every time.
             **request_parameters: Additional request parameters (provides
                 support for parameters that may be added in the future).
 
@@ -110,36 +444,158 @@ class RecordingReportAPI(object):
             TypeError: If the parameter types are incorrect.
             ApiError: If the Webex Teams cloud returns an error.
         """
-        check_type(max, int, optional=True)
-        check_type(_from, basestring, optional=True)
-        check_type(to, basestring, optional=True)
-        check_type(hostEmail, basestring, optional=True)
-        check_type(siteUrl, basestring, optional=True)
+        params = self._access_summary_params(
+            max, _from, to, hostEmail, siteUrl, request_parameters
+        )
+        check_type(cache_ttl, (int, float), optional=True)
+
+        # Shared by the iterators of this container only
+        page_cache = FirstPageCache(cache_ttl) if cache_ttl else None
 
-        params = dict_from_items_with_values(
-            request_parameters,
-            max_recordings=max,
-            _from=_from,
-            to=to,
-            hostEmail=hostEmail,
-            siteUrl=siteUrl,
+        return self._access_summary_raw(
+            params,
+            prefetch=prefetch,
+            cached=cached and bool(_from and to and not request_parameters),
+            prefetch_detail=prefetch_detail,
+            page_cache=page_cache,
         )
 
-        items = self._session.get_items(API_ENDPOINT + "/accessSummary", params=params)
+    @generator_container
+    def _access_summary_raw(
+        self,
+        params,
+        prefetch=False,
+        cached=False,
+        prefetch_detail=False,
+        page_cache=None,
+        max=None,
+    ):
+        """Yield the recordings of an access summary query.
+
+        Takes the request params already checked and built by
+        :meth:`access_summary`, so new iterators of the returned container
+        don't repeat that work.  `max` is only set by the container when it is
+        sliced, and is ignored if the params already have one.
+
+        """
+        if max is not None and "max" not in params:
+            params = dict(params, max=max)
+
+        if cached:
+            items = self._cached_access_summary_items(params, prefetch)
+        else:
+            items = None
+
+        if items is None:
+            items = self._session.get_items(
+                API_ENDPOINT + "/accessSummary",
+                params=params,
+                prefetch=prefetch,
+                page_cache=page_cache,
+            )
 
         for item in items:
+            if prefetch_detail and item.get("recordingId"):
+                self._prefetch_detail(item["recordingId"])
+
             yield self._object_factory(OBJECT_TYPE, item)
 
+    def _prefetch_detail(self, recordingId):
+        """Start a background access detail request for a recording.
+
+        A recording that is listed again is requested again, replacing its
+        earlier prefetched detail.
+
+        """
+        with self._prefetch_lock:
+            # Don't queue up requests faster than they can be made
+            if not self._detail_slots.acquire(blocking=False):
+                return
+
+            if self._detail_executor is None:
+                self._detail_executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=DETAIL_PREFETCH_WORKERS
+                )
+
+            future = self._detail_executor.submit(
+                self._session.get,
+                API_ENDPOINT + "/accessDetail",
+                params={"recordingId": recordingId},
+            )
+            future.add_done_callback(lambda _: self._detail_slots.release())
+
+            self._prefetched_details.pop(recordingId, None)
+            self._prefetched_details[recordingId] = (future, time.monotonic())
+            while len(self._prefetched_details) > DETAIL_PREFETCH_MAX_RESULTS:
+                self._prefetched_details.popitem(last=False)
+
+    def _pop_prefetched_detail(self, recordingId):
+        """Return the prefetched access detail JSON for a recording, or None.
+
+        Prefetches requested more than DETAIL_PREFETCH_TTL seconds ago are
+        dropped, and failed prefetches return None, so that the request is
+        made again; any error is then raised to the caller.
+
+        """
+        with self._prefetch_lock:
+            prefetched = self._prefetched_details.pop(recordingId, None)
+
+        if prefetched is None:
+            return None
+
+        future, requested_at = prefetched
+        if time.monotonic() - requested_at > DETAIL_PREFETCH_TTL:
+            return None
+
+        try:
+            return future.result()
+        except Exception:
+            return None
+
+    def _cached_access_summary_items(self, params, prefetch):
+        """Return the access summary items for params, using the cache.
+
+        Only the parts of the requested window that aren't cached are fetched.
+        Returns None if the window or the fetched items can't be cached, or
+        the window is no longer completely cached once they are stored.
+
+        """
+        try:
+            start = _parse_iso(params["from"])
+            end = _parse_iso(params["to"])
+        except ValueError:
+            return None
+
+        key = (params.get("hostEmail"), params.get("siteUrl"))
+
+        for gap_start, gap_end in self._coverage.gaps(key, start, end):
+            gap_params = params.copy()
+            gap_params["from"] = str(gap_start)
+            gap_params["to"] = str(gap_end)
+
+            gap_items = list(
+                self._session.get_items(
+                    API_ENDPOINT + "/accessSummary",
+                    params=gap_params,
+                    prefetch=prefetch,
+                )
+            )
+
+            if not self._coverage.add(key, gap_start, gap_end, gap_items):
+                return None
+
+        return self._coverage.items(key, start, end)
+
     def access_detail(
         self, recordingId, max=None, hostEmail=None, **request_parameters
     ):
         """Retrieves details for a recording audit report with a specified recording ID.
 
         Args:
-            recordingId(basestring): The ID of the recording to be retrieved.
+            recordingId(str): The ID of the recording to be retrieved.
             max(int): Limit the maximum number of items returned from the Webex
                 Teams service per request.
-            hostEmail(basestring): Email address of meeting host.
+            hostEmail(str): Email address of meeting host.
 
         Returns:
             Recording: A RecordingReport object with the details of the requested
@@ -150,17 +606,199 @@ class RecordingReportAPI(object):
             ApiError: If the Webex Teams cloud returns an error.
 
         """
-        check_type(max, int, optional=True)
-        check_type(recordingId, basestring)
-        check_type(hostEmail, basestring, optional=True)
+        params = self._access_detail_params(
+            recordingId, max, hostEmail, request_parameters
+        )
+
+        json_data = None
+        if len(params) == 1 and self._prefetched_details:
+            json_data = self._pop_prefetched_detail(recordingId)
+
+        if json_data is None:
+            json_data = self._session.get(
+                API_ENDPOINT + "/accessDetail", params=params
+            )
+
+        return self._object_factory(OBJECT_TYPE, json_data)
+
+    async def access_summary_async(
+        self,
+        max=None,
+        _from=None,
+        to=None,
+        hostEmail="all",
+        siteUrl=None,
+        **request_parameters,
+    ):
+        """Lists recording audit report summary asynchronously.
+
+        Asynchronous version of :meth:`access_summary`.  Returns an async
+        generator that incrementally yields all recordings returned by the
+        query, requesting additional 'pages' of responses from Webex as needed.
+        Requires the package of the configured `async_backend`.
+
+        Args:
+            max(int): Limit the maximum number of items returned from the Webex
+                Teams service per request.
+            _from(str): List recording audit report which occurred after a
+                specific date and time.
+            to(str): List recording audit report which occurred before a
+                specific date and time.
+            hostEmail(str): Email address of meeting host. Default is "all".
+            siteUrl(str): URL of the Webex site which the API lists
+                recordings from.
+            **request_parameters: Additional request parameters (provides
+                support for parameters that may be added in the future).
+
+        Returns:
+            AsyncGenerator: An async generator which yields the recordings
+            returned by the Webex Teams query.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+            ApiError: If the Webex Teams cloud returns an error.
+        """
+        params = self._access_summary_params(
+            max, _from, to, hostEmail, siteUrl, request_parameters
+        )
+
+        items = self._asession.get_items(
+            API_ENDPOINT + "/accessSummary", params=params
+        )
+
+        async for item in items:
+            yield self._object_factory(OBJECT_TYPE, item)
+
+    async def access_detail_async(
+        self, recordingId, max=None, hostEmail=None, **request_parameters
+    ):
+        """Retrieves details for a recording audit report asynchronously.
+
+        Asynchronous version of :meth:`access_detail`.  Requires the package
+        of the configured `async_backend`.
+
+        Args:
+            recordingId(str): The ID of the recording to be retrieved.
+            max(int): Limit the maximum number of items returned from the Webex
+                Teams service per request.
+            hostEmail(str): Email address of meeting host.
+
+        Returns:
+            RecordingReport: A RecordingReport object with the details of the
+            requested recording.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+            ApiError: If the Webex Teams cloud returns an error.
+
+        """
+        params = self._access_detail_params(
+            recordingId, max, hostEmail, request_parameters
+        )
+
+        return await self._access_detail(self._asession, params)
+
+    async def access_details_bulk(
+        self, recording_ids, hostEmail=None, concurrency=10
+    ):
+        """Retrieves the recording audit report details of several recordings.
+
+        The requests are made concurrently over the shared connection pool,
+        with at most `concurrency` requests in flight at any time; with the
+        "httpx" backend they share a single multiplexed HTTP/2 connection.
+        Requires the package of the configured `async_backend`.
+
+        Args:
+            recording_ids(list): The IDs of the recordings to be retrieved.
+            hostEmail(str): Email address of meeting host.
+            concurrency(int): The maximum number of simultaneous requests.
+
+        Returns:
+            list: The RecordingReport objects with the details of the
+            requested recordings, in the same order as `recording_ids`.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+            ValueError: If `concurrency` is not a positive integer.
+            ApiError: If the Webex Teams cloud returns an error.
+
+        """
+        params_list = self._access_details_params(
+            recording_ids, hostEmail, concurrency
+        )
+
+        return await self._access_details(
+            self._asession, params_list, concurrency
+        )
+
+    def access_details(self, recording_ids, hostEmail=None, concurrency=10):
+        """Retrieves the recording audit report details of several recordings.
+
+        Synchronous version of :meth:`access_details_bulk`.  The requests are
+        submitted as one batch and made concurrently, with at most
+        `concurrency` requests in flight at any time, by an event loop running
+        in a background thread.  Requires the package of the configured
+        `async_backend`.
+
+        Args:
+            recording_ids(list): The IDs of the recordings to be retrieved.
+            hostEmail(str): Email address of meeting host.
+            concurrency(int): The maximum number of simultaneous requests.
+
+        Returns:
+            list: The RecordingReport objects with the details of the
+            requested recordings, in the same order as `recording_ids`.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+            ValueError: If `concurrency` is not a positive integer.
+            ApiError: If the Webex Teams cloud returns an error.
+
+        """
+        params_list = self._access_details_params(
+            recording_ids, hostEmail, concurrency
+        )
 
-        params = dict_from_items_with_values(
-            request_parameters,
-            max=max,
-            recordingId=recordingId,
-            hostEmail=hostEmail,
+        return self._run_coroutine(
+            self._access_details_on_loop(params_list, concurrency)
         )
 
-        json_data = self._session.get(API_ENDPOINT + "/accessDetail", params=params)
+    def _access_details_params(self, recording_ids, hostEmail, concurrency):
+        """Check the bulk access detail arguments and build the params."""
+        check_type(recording_ids, (list, tuple))
+        check_type(concurrency, int)
+        if concurrency <= 0:
+            raise ValueError("concurrency must be a positive integer")
+
+        return [
+            self._access_detail_params(recordingId, None, hostEmail, {})
+            for recordingId in recording_ids
+        ]
+
+    async def _access_detail(self, asession, params):
+        """Retrieve one recording audit report detail using `asession`."""
+        json_data = await asession.get(
+            API_ENDPOINT + "/accessDetail", params=params
+        )
 
         return self._object_factory(OBJECT_TYPE, json_data)
+
+    async def _access_details(self, asession, params_list, concurrency):
+        """Retrieve several recording audit report details using `asession`."""
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def bounded_access_detail(params):
+            async with semaphore:
+                return await self._access_detail(asession, params)
+
+        results = await asyncio.gather(
+            *(bounded_access_detail(params) for params in params_list)
+        )
+
+        return list(results)
+
+    async def _access_details_on_loop(self, params_list, concurrency):
+        """Retrieve recording audit report details on the background loop."""
+        return await self._access_details(
+            self._loop_asession, params_list, concurrency
+        )
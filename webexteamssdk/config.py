@@ -30,6 +30,28 @@ DEFAULT_SINGLE_REQUEST_TIMEOUT = 60
 
 DEFAULT_WAIT_ON_RATE_LIMIT = True
 
+DEFAULT_CONNECTION_POOL_SIZE = 20
+
+DEFAULT_MAX_RETRIES = 3
+
+DEFAULT_RETRY_BACKOFF_FACTOR = 0.3
+
+RETRY_STATUS_CODES = [502, 503, 504]
+
+DEFAULT_PAGE_CACHE_TTL = 5
+
+PAGE_CACHE_MAX_ENTRIES = 64
+
+DEFAULT_ASYNC_CONNECTION_LIMIT = 20
+
+DEFAULT_ASYNC_DNS_CACHE_TTL = 300
+
+DEFAULT_ASYNC_KEEPALIVE_CONNECTIONS = 10
+
+ASYNC_BACKENDS = ["aiohttp", "httpx"]
+
+DEFAULT_ASYNC_BACKEND = "aiohttp"
+
 ACCESS_TOKEN_ENVIRONMENT_VARIABLE = "WEBEX_TEAMS_ACCESS_TOKEN"
 
 LEGACY_ACCESS_TOKEN_ENVIRONMENT_VARIABLES = [
@@ -43,8 +43,7 @@ def dict_data_factory(model, json_data):
             which to initialize the object.
 
     Returns:
-        OrderedDict: An ordered dictionary with the contents of the Webex Teams
-         JSON object.
+        dict: A dictionary with the contents of the Webex Teams JSON object.
 
     Raises:
         TypeError: If the json_data parameter is not a JSON string or
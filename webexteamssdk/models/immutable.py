@@ -72,7 +72,19 @@ from .mixins.webhook_event import WebhookEventBasicPropertiesMixin
 
 
 class ImmutableData(object):
-    """Model a Webex Teams JSON object as an immutable native Python object."""
+    """Model a Webex Teams JSON object as an immutable native Python object.
+
+    ImmutableData objects have no instance `__dict__`: `vars()` can't be used
+    on them and new attributes can't be set on them.  This includes the
+    objects created for unknown data models and for nested JSON objects.
+    Subclasses that don't declare `__slots__` (most data models) still get an
+    instance `__dict__`.
+
+    """
+
+    # Slotted so that the models that declare __slots__ (see Recording) have
+    # no per-instance __dict__
+    __slots__ = ("_json_data", "__weakref__")
 
     def __init__(self, json_data):
         """Init a new ImmutableData object from a dictionary or JSON string.
@@ -166,7 +178,7 @@ class ImmutableData(object):
 
     @property
     def json_data(self):
-        """A copy of the data object's JSON data (OrderedDict)."""
+        """A copy of the data object's JSON data (dict)."""
         # TODO: When we move to Python v3+ only; use MappingProxyType.
         return self._json_data.copy()
 
@@ -278,10 +290,40 @@ class GuestIssuerToken(ImmutableData, GuestIssuerTokenBasicPropertiesMixin):
 class RecordingReport(ImmutableData, RecordingReportBasicPropertiesMixin):
     """Webex Teams Recording data model"""
 
+    __slots__ = RecordingReportBasicPropertiesMixin._property_slots
+
+    def __init__(self, json_data):
+        """Init a new RecordingReport object from a dictionary or JSON string.
+
+        Args:
+            json_data(dict, basestring): Input JSON string or dictionary.
+
+        Raises:
+            TypeError: If the input object is not a dictionary or string.
+
+        """
+        super(RecordingReport, self).__init__(json_data)
+        self._load_json_data(self._json_data)
+
 
 class Recording(ImmutableData, RecordingBasicPropertiesMixin):
     """Webex Teams Recording data model"""
 
+    __slots__ = RecordingBasicPropertiesMixin._property_slots
+
+    def __init__(self, json_data):
+        """Init a new Recording object from a dictionary or JSON string.
+
+        Args:
+            json_data(dict, basestring): Input JSON string or dictionary.
+
+        Raises:
+            TypeError: If the input object is not a dictionary or string.
+
+        """
+        super(Recording, self).__init__(json_data)
+        self._load_json_data(self._json_data)
+
 
 class Meeting(ImmutableData, MeetingBasicPropertiesMixin):
     """Webex Meeting data model"""
@@ -315,6 +357,7 @@ immutable_data_models = defaultdict(
     webhook_event=WebhookEvent,
     guest_issuer_token=GuestIssuerToken,
     recording=Recording,
+    recording_report=RecordingReport,
     meeting=Meeting,
     meetingTemplate=MeetingTemplate,
     meetingInvitee=MeetingInvitees,
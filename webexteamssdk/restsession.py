@@ -36,20 +36,40 @@ from future import standard_library
 
 standard_library.install_aliases()
 
+import asyncio
 import json
 import logging
 import platform
+import queue
 import sys
+import threading
 import time
 import urllib
 import urllib.parse
 import warnings
+from collections import OrderedDict
 
 import requests
 from past.builtins import basestring
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.util.retry import Retry
 
 from ._metadata import __title__, __version__
-from .config import DEFAULT_SINGLE_REQUEST_TIMEOUT, DEFAULT_WAIT_ON_RATE_LIMIT
+from .config import (
+    ASYNC_BACKENDS,
+    DEFAULT_ASYNC_BACKEND,
+    DEFAULT_ASYNC_CONNECTION_LIMIT,
+    DEFAULT_ASYNC_DNS_CACHE_TTL,
+    DEFAULT_ASYNC_KEEPALIVE_CONNECTIONS,
+    DEFAULT_CONNECTION_POOL_SIZE,
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_RETRY_BACKOFF_FACTOR,
+    DEFAULT_SINGLE_REQUEST_TIMEOUT,
+    DEFAULT_WAIT_ON_RATE_LIMIT,
+    PAGE_CACHE_MAX_ENTRIES,
+    RETRY_STATUS_CODES,
+)
 from .exceptions import MalformedResponse, RateLimitError, RateLimitWarning
 from .response_codes import EXPECTED_RESPONSE_CODE
 from .utils import (
@@ -59,9 +79,28 @@ from .utils import (
     validate_base_url,
 )
 
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+
 logger = logging.getLogger(__name__)
 
 
+# How often (seconds) a page-prefetch thread waiting on a full queue checks
+# whether its consumer has stopped
+_PREFETCH_POLL_INTERVAL = 0.1
+
+# Queued by the page-prefetch thread after the last page
+_END_OF_PAGES = object()
+
+
 # Helper Functions
 def _fix_next_url(next_url):
     """Remove max=null parameter from URL.
@@ -108,6 +147,50 @@ def _fix_next_url(next_url):
     return urllib.parse.urlunparse(parsed_url)
 
 
+def _next_page_url(response):
+    """Return the RFC5988 "next" URL of a paged response, or None."""
+    if response.links.get("next"):
+        next_url = response.links.get("next").get("url")
+
+        # Patch for Webex Teams "max=null" in next URL bug.
+        # Testing shows that patch is no longer needed; raising a
+        # warnning if it is still taking effect;
+        # considering for future removal
+        return _fix_next_url(next_url)
+
+
+def _requests_response(method, url, status_code, reason, headers, encoding,
+                       content):
+    """Build a requests.Response object from a completed async response.
+
+    This lets the asynchronous session reuse the response-code checks,
+    exceptions and JSON parsing that are written against the requests package.
+
+    Args:
+        method(basestring): The request-method type ("GET", "POST", etc.).
+        url(basestring): The URL of the response.
+        status_code(int): The HTTP status code of the response.
+        reason(basestring): The HTTP reason phrase of the response.
+        headers(Mapping): The HTTP headers of the response.
+        encoding(basestring): The character encoding of the body, if known.
+        content(bytes): The response body, already read from the connection.
+
+    Returns:
+        requests.Response: A requests.Response with the status, headers and
+        body of the response.
+
+    """
+    response = requests.Response()
+    response.status_code = status_code
+    response.reason = reason
+    response.headers = CaseInsensitiveDict(headers)
+    response.url = url
+    response.encoding = encoding or "utf-8"
+    response._content = content
+    response.request = requests.Request(method, url).prepare()
+    return response
+
+
 def user_agent(be_geo_id=None, caller=None):
     """Build a User-Agent HTTP header string."""
 
@@ -176,6 +259,62 @@ def user_agent(be_geo_id=None, caller=None):
     return user_agent_string
 
 
+class FirstPageCache(object):
+    """Recently requested first pages of paginated requests.
+
+    Lets repeated iterations of the same query reuse its first page for `ttl`
+    seconds instead of requesting it again.  A cache is meant to be shared
+    only by the iterations of one query, e.g. one GeneratorContainer, so that
+    separate calls always see fresh data.
+
+    """
+
+    def __init__(self, ttl, max_entries=PAGE_CACHE_MAX_ENTRIES):
+        """Initialize a new FirstPageCache object.
+
+        Args:
+            ttl(int, float): The number of seconds a first page is reused for.
+            max_entries(int): The maximum number of first pages kept; the
+                least recently stored pages are evicted first.
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+
+        """
+        check_type(ttl, (int, float))
+        check_type(max_entries, int)
+
+        super(FirstPageCache, self).__init__()
+
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._pages = OrderedDict()
+
+    @staticmethod
+    def key(abs_url, params):
+        """Return the cache key of a GET request."""
+        query = urllib.parse.urlencode(
+            sorted((params or {}).items()), doseq=True
+        )
+        return abs_url, query
+
+    def get(self, key):
+        """Return the cached first-page response for key, or None."""
+        cached = self._pages.get(key)
+        if cached is not None:
+            response, cached_at = cached
+            if time.monotonic() - cached_at < self._ttl:
+                return response
+            self._pages.pop(key, None)
+
+    def put(self, key, response):
+        """Cache a first-page response, evicting the oldest entries."""
+        self._pages.pop(key, None)
+        self._pages[key] = (response, time.monotonic())
+        while len(self._pages) > self._max_entries:
+            self._pages.popitem(last=False)
+
+
 # Main module interface
 class RestSession(object):
     """RESTful HTTP session class for making calls to the Webex Teams APIs."""
@@ -236,6 +375,22 @@ class RestSession(object):
         # Initialize a new session
         self._req_session = requests.session()
 
+        # Keep a pool of open connections for reuse across API calls, and
+        # retry idempotent requests on transient server errors.  Rate-limit
+        # (429) responses are left to the wait_on_rate_limit handling.
+        adapter = HTTPAdapter(
+            pool_connections=DEFAULT_CONNECTION_POOL_SIZE,
+            pool_maxsize=DEFAULT_CONNECTION_POOL_SIZE,
+            max_retries=Retry(
+                total=DEFAULT_MAX_RETRIES,
+                backoff_factor=DEFAULT_RETRY_BACKOFF_FACTOR,
+                status_forcelist=RETRY_STATUS_CODES,
+                raise_on_status=False,
+            ),
+        )
+        self._req_session.mount("https://", adapter)
+        self._req_session.mount("http://", adapter)
+
         # Disable ssl cert verification if chosen by user
         if disable_ssl_verify:
             self._req_session.verify = False
@@ -313,6 +468,15 @@ class RestSession(object):
         check_type(headers, dict)
         self._req_session.headers.update(headers)
 
+    def close(self):
+        """Close the session's pooled connections.
+
+        The session may still be used afterwards; new connections are opened
+        as needed.
+
+        """
+        self._req_session.close()
+
     def abs_url(self, url):
         """Given a relative or absolute URL; return an absolute URL.
 
@@ -403,7 +567,9 @@ class RestSession(object):
         response = self.request("GET", url, erc, params=params, **kwargs)
         return extract_and_parse_json(response)
 
-    def get_pages(self, url, params=None, **kwargs):
+    def get_pages(
+        self, url, params=None, prefetch=False, page_cache=None, **kwargs
+    ):
         """Return a generator that GETs and yields pages of data.
 
         Provides native support for RFC5988 Web Linking.
@@ -411,6 +577,13 @@ class RestSession(object):
         Args:
             url(basestring): The URL of the API endpoint.
             params(dict): The parameters for the HTTP GET request.
+            prefetch(bool, int): The number of pages to request ahead, in a
+                background thread, while the current page is being consumed.
+                True reads one page ahead.
+            page_cache(FirstPageCache): Reuse the first page of an identical
+                request stored in this cache, continuing the pagination from
+                its "next" link, and store the first page of new requests in
+                it.  None disables caching.
             **kwargs:
                 erc(int): The expected (success) response code for the request.
                 others: Passed on to the requests package.
@@ -422,32 +595,108 @@ class RestSession(object):
         """
         check_type(url, basestring)
         check_type(params, dict, optional=True)
+        check_type(prefetch, int)
+        check_type(page_cache, FirstPageCache, optional=True)
+        if prefetch < 0:
+            raise ValueError("prefetch must be a non-negative integer")
 
         # Expected response code
         erc = kwargs.pop("erc", EXPECTED_RESPONSE_CODE["GET"])
 
-        # First request
-        response = self.request("GET", url, erc, params=params, **kwargs)
+        # Only plain requests are cached; other kwargs may change the response
+        cache_key = None
+        if page_cache is not None and not kwargs:
+            cache_key = page_cache.key(self.abs_url(url), params)
 
-        while True:
-            yield extract_and_parse_json(response)
+        response = None
+        if cache_key is not None:
+            response = page_cache.get(cache_key)
+
+        if response is None:
+            # First request
+            response = self.request("GET", url, erc, params=params, **kwargs)
 
-            if response.links.get("next"):
-                next_url = response.links.get("next").get("url")
+            if cache_key is not None:
+                page_cache.put(cache_key, response)
 
-                # Patch for Webex Teams "max=null" in next URL bug.
-                # Testing shows that patch is no longer needed; raising a
-                # warnning if it is still taking effect;
-                # considering for future removal
-                next_url = _fix_next_url(next_url)
+        if prefetch:
+            for json_page in self._prefetched_pages(
+                response, erc, int(prefetch), **kwargs
+            ):
+                yield json_page
+            return
 
+        while True:
+            yield extract_and_parse_json(response)
+
+            next_url = _next_page_url(response)
+            if next_url:
                 # Subsequent requests
                 response = self.request("GET", next_url, erc, **kwargs)
 
             else:
                 break
 
-    def get_items(self, url, params=None, **kwargs):
+    def _prefetched_pages(self, response, erc, depth, **kwargs):
+        """Yield pages of data, read ahead by a background producer thread.
+
+        The producer follows the "next" links and queues up to `depth` parsed
+        pages ahead of the consumer, so request latency overlaps with the
+        consumer's processing.  Pages are queued in link order.  The producer
+        is stopped when the generator finishes or is closed.
+
+        """
+        pages = queue.Queue(maxsize=depth)
+        stop = threading.Event()
+
+        def put(entry):
+            """Queue an entry; give up if the consumer has gone away."""
+            while not stop.is_set():
+                try:
+                    pages.put(entry, timeout=_PREFETCH_POLL_INTERVAL)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def produce(response):
+            try:
+                while True:
+                    next_url = _next_page_url(response)
+                    if not put(extract_and_parse_json(response)):
+                        return
+                    if not next_url:
+                        break
+                    response = self.request("GET", next_url, erc, **kwargs)
+            except Exception as e:
+                put(e)
+            else:
+                put(_END_OF_PAGES)
+
+        producer = threading.Thread(
+            target=produce,
+            args=(response,),
+            name="RestSession-page-prefetch",
+            daemon=True,
+        )
+        producer.start()
+
+        try:
+            while True:
+                entry = pages.get()
+                if entry is _END_OF_PAGES:
+                    break
+                elif isinstance(entry, Exception):
+                    raise entry
+                else:
+                    yield entry
+        finally:
+            # Don't block a consumer that stops early on the in-flight request
+            stop.set()
+
+    def get_items(
+        self, url, params=None, prefetch=False, page_cache=None, **kwargs
+    ):
         """Return a generator that GETs and yields individual JSON `items`.
 
         Yields individual `items` from Webex Teams"s top-level {"items": [...]}
@@ -458,6 +707,11 @@ class RestSession(object):
         Args:
             url(basestring): The URL of the API endpoint.
             params(dict): The parameters for the HTTP GET request.
+            prefetch(bool, int): The number of pages to request ahead, in a
+                background thread, while the current page's items are being
+                consumed.  True reads one page ahead.
+            page_cache(FirstPageCache): Reuse the first page of an identical
+                request stored in this cache, see :meth:`get_pages`.
             **kwargs:
                 erc(int): The expected (success) response code for the request.
                 others: Passed on to the requests package.
@@ -470,7 +724,13 @@ class RestSession(object):
 
         """
         # Get generator for pages of JSON data
-        pages = self.get_pages(url, params=params, **kwargs)
+        pages = self.get_pages(
+            url,
+            params=params,
+            prefetch=prefetch,
+            page_cache=page_cache,
+            **kwargs
+        )
 
         for json_page in pages:
             assert isinstance(json_page, dict)
@@ -555,3 +815,374 @@ class RestSession(object):
         erc = kwargs.pop("erc", EXPECTED_RESPONSE_CODE["DELETE"])
 
         self.request("DELETE", url, erc, **kwargs)
+
+
+class AsyncRestSession(object):
+    """Asynchronous HTTP session for making calls to the Webex Teams APIs.
+
+    Makes its requests with aiohttp, or with httpx over HTTP/2, using the base
+    URL, HTTP headers, timeout and rate-limit settings of the RestSession it
+    wraps.  The underlying client is created on first use, keeps its
+    connections open for reuse, and must be closed with :meth:`aclose`.  The
+    client is bound to the event loop that created it: it is replaced when the
+    session is used from a different loop, and is closed when its loop is shut
+    down by asyncio.run().  A session should only be used by one event loop at
+    a time.
+
+    With the "httpx" backend, concurrent requests to the same host are
+    multiplexed over a single HTTP/2 connection when the server supports it.
+
+    """
+
+    def __init__(
+        self,
+        rest_session,
+        connection_limit=DEFAULT_ASYNC_CONNECTION_LIMIT,
+        dns_cache_ttl=DEFAULT_ASYNC_DNS_CACHE_TTL,
+        backend=DEFAULT_ASYNC_BACKEND,
+    ):
+        """Initialize a new AsyncRestSession object.
+
+        Args:
+            rest_session(RestSession): The RESTful session providing the base
+                URL, headers, timeout and rate-limit settings.
+            connection_limit(int): The maximum number of simultaneous
+                connections kept by the session.
+            dns_cache_ttl(int): The number of seconds resolved DNS entries are
+                cached for by the "aiohttp" backend.  None caches them forever.
+            backend(basestring): The HTTP client package to use, "aiohttp" or
+                "httpx" (HTTP/2).
+
+        Raises:
+            TypeError: If the parameter types are incorrect.
+            ValueError: If `backend` is not a supported backend.
+
+        """
+        check_type(rest_session, RestSession)
+        check_type(connection_limit, int)
+        check_type(dns_cache_ttl, int, optional=True)
+        check_type(backend, basestring)
+        if backend not in ASYNC_BACKENDS:
+            raise ValueError(
+                "backend must be one of: {}".format(", ".join(ASYNC_BACKENDS))
+            )
+
+        super(AsyncRestSession, self).__init__()
+
+        self._rest_session = rest_session
+        self._connection_limit = connection_limit
+        self._dns_cache_ttl = dns_cache_ttl
+        self._backend = backend
+        self._client = None
+        self._client_loop = None
+        self._client_closer = None
+
+    @property
+    def rest_session(self):
+        """The RESTful session whose settings are used for requests."""
+        return self._rest_session
+
+    @property
+    def backend(self):
+        """The HTTP client package used for requests."""
+        return self._backend
+
+    async def _get_client(self):
+        """Return the aiohttp or httpx client, creating it if needed.
+
+        The client and its connections belong to the event loop that created
+        it; a new client is created when the session is used from another
+        event loop, e.g. by a later asyncio.run() call.
+
+        """
+        loop = asyncio.get_running_loop()
+
+        if self._client is not None and (
+            self._client_loop is not loop or self._client_is_closed()
+        ):
+            await self._release_client()
+
+        if self._client is None:
+            if self._backend == "httpx":
+                client = self._new_httpx_client()
+            else:
+                client = self._new_aiohttp_client()
+
+            closer = self._close_on_loop_shutdown(client, loop)
+            await closer.__anext__()
+
+            self._client = client
+            self._client_loop = loop
+            self._client_closer = closer
+
+        return self._client
+
+    def _client_is_closed(self):
+        """Whether the current client has been closed."""
+        if self._backend == "httpx":
+            return self._client.is_closed
+        else:
+            return self._client.closed
+
+    async def _close_on_loop_shutdown(self, client, loop):
+        """Keep a client open until it is released or its loop shuts down.
+
+        asyncio.run() finalizes the asynchronous generators of its event loop
+        before closing the loop, so a client that is still open when the loop
+        shuts down is closed on that loop, with its connections.  A client
+        released from another loop, after its own loop has stopped, can't be
+        closed; its connections are dropped when it is garbage collected.
+
+        """
+        try:
+            yield
+        finally:
+            if self._client is client:
+                self._client = None
+                self._client_loop = None
+                self._client_closer = None
+
+            if asyncio.get_running_loop() is loop:
+                if self._backend == "httpx":
+                    await client.aclose()
+                else:
+                    await client.close()
+
+    async def _release_client(self):
+        """Forget the current client, closing it on its own event loop."""
+        closer, loop = self._client_closer, self._client_loop
+        self._client = None
+        self._client_loop = None
+        self._client_closer = None
+
+        if closer is None:
+            return
+
+        if loop.is_running() and loop is not asyncio.get_running_loop():
+            # The client's loop is running in another thread
+            asyncio.run_coroutine_threadsafe(closer.aclose(), loop)
+        else:
+            await closer.aclose()
+
+    def _new_aiohttp_client(self):
+        """Create a new aiohttp.ClientSession."""
+        if aiohttp is None:
+            raise ImportError(
+                "The aiohttp package is required to make asynchronous API "
+                "calls; install it with `pip install webexteamssdk[async]`."
+            )
+
+        connector = aiohttp.TCPConnector(
+            limit=self._connection_limit,
+            ttl_dns_cache=self._dns_cache_ttl,
+            ssl=None if self._rest_session._req_session.verify else False,
+        )
+        return aiohttp.ClientSession(connector=connector)
+
+    def _new_httpx_client(self):
+        """Create a new HTTP/2 httpx.AsyncClient."""
+        if httpx is None:
+            raise ImportError(
+                "The httpx package is required to make HTTP/2 API calls; "
+                "install it with `pip install webexteamssdk[http2]`."
+            )
+
+        proxies = self._rest_session._req_session.proxies
+        return httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=DEFAULT_ASYNC_KEEPALIVE_CONNECTIONS,
+                max_connections=self._connection_limit,
+            ),
+            verify=bool(self._rest_session._req_session.verify),
+            proxy=proxies.get("https") or proxies.get("http"),
+        )
+
+    async def aclose(self):
+        """Close the aiohttp or httpx client and its open connections."""
+        await self._release_client()
+
+    async def _send(self, method, url, **kwargs):
+        """Make one HTTP request and return it as a requests.Response."""
+        client = await self._get_client()
+        headers = self._rest_session.headers
+        timeout = self._rest_session.single_request_timeout
+
+        if self._backend == "httpx":
+            kwargs.setdefault("timeout", timeout)
+            httpx_response = await client.request(
+                method, url, headers=headers, **kwargs
+            )
+            return _requests_response(
+                method,
+                str(httpx_response.url),
+                httpx_response.status_code,
+                httpx_response.reason_phrase,
+                httpx_response.headers,
+                httpx_response.charset_encoding,
+                httpx_response.content,
+            )
+
+        kwargs.setdefault("timeout", aiohttp.ClientTimeout(total=timeout))
+        proxies = self._rest_session._req_session.proxies
+        scheme = urllib.parse.urlparse(url).scheme
+        if proxies.get(scheme):
+            kwargs.setdefault("proxy", proxies[scheme])
+
+        async with client.request(
+            method, url, headers=headers, **kwargs
+        ) as aio_response:
+            content = await aio_response.read()
+
+        return _requests_response(
+            method,
+            str(aio_response.url),
+            aio_response.status,
+            aio_response.reason,
+            aio_response.headers,
+            aio_response.charset,
+            content,
+        )
+
+    async def request(self, method, url, erc, **kwargs):
+        """Abstract base method for making requests to the Webex Teams APIs.
+
+        This base method:
+            * Expands the API endpoint URL to an absolute URL
+            * Makes the actual HTTP request to the API endpoint
+            * Provides support for Webex Teams rate-limiting
+            * Inspects response codes and raises exceptions as appropriate
+
+        Args:
+            method(basestring): The request-method type ("GET", "POST", etc.).
+            url(basestring): The URL of the API endpoint to be called.
+            erc(int): The expected response code that should be returned by the
+                Webex Teams API endpoint to indicate success.
+            **kwargs: Passed on to the aiohttp or httpx package.
+
+        Returns:
+            requests.Response: The response, wrapped as a requests.Response.
+
+        Raises:
+            ApiError: If anything other than the expected response code is
+                returned by the Webex Teams API endpoint.
+
+        """
+        # Ensure the url is an absolute URL
+        abs_url = self._rest_session.abs_url(url)
+
+        while True:
+            # Make the HTTP request to the API endpoint
+            response = await self._send(method, abs_url, **kwargs)
+
+            try:
+                # Check the response code for error conditions
+                check_response_code(response, erc)
+            except RateLimitError as e:
+                # Catch rate-limit errors
+                # Wait and retry if automatic rate-limit handling is enabled
+                if self._rest_session.wait_on_rate_limit:
+                    warnings.warn(RateLimitWarning(response))
+                    await asyncio.sleep(e.retry_after)
+                    continue
+                else:
+                    # Re-raise the RateLimitError
+                    raise
+            else:
+                return response
+
+    async def get(self, url, params=None, **kwargs):
+        """Sends a GET request.
+
+        Args:
+            url(basestring): The URL of the API endpoint.
+            params(dict): The parameters for the HTTP GET request.
+            **kwargs:
+                erc(int): The expected (success) response code for the request.
+                others: Passed on to the aiohttp or httpx package.
+
+        Raises:
+            ApiError: If anything other than the expected response code is
+                returned by the Webex Teams API endpoint.
+
+        """
+        check_type(url, basestring)
+        check_type(params, dict, optional=True)
+
+        # Expected response code
+        erc = kwargs.pop("erc", EXPECTED_RESPONSE_CODE["GET"])
+
+        response = await self.request("GET", url, erc, params=params, **kwargs)
+        return extract_and_parse_json(response)
+
+    async def get_pages(self, url, params=None, **kwargs):
+        """Return an async generator that GETs and yields pages of data.
+
+        Provides native support for RFC5988 Web Linking.
+
+        Args:
+            url(basestring): The URL of the API endpoint.
+            params(dict): The parameters for the HTTP GET request.
+            **kwargs:
+                erc(int): The expected (success) response code for the request.
+                others: Passed on to the aiohttp or httpx package.
+
+        Raises:
+            ApiError: If anything other than the expected response code is
+                returned by the Webex Teams API endpoint.
+
+        """
+        check_type(url, basestring)
+        check_type(params, dict, optional=True)
+
+        # Expected response code
+        erc = kwargs.pop("erc", EXPECTED_RESPONSE_CODE["GET"])
+
+        # First request
+        response = await self.request("GET", url, erc, params=params, **kwargs)
+
+        while True:
+            yield extract_and_parse_json(response)
+
+            next_url = _next_page_url(response)
+            if next_url:
+                # Subsequent requests
+                response = await self.request("GET", next_url, erc, **kwargs)
+
+            else:
+                break
+
+    async def get_items(self, url, params=None, **kwargs):
+        """Return an async generator that GETs and yields individual `items`.
+
+        Yields individual `items` from Webex Teams"s top-level {"items": [...]}
+        JSON objects. Provides native support for RFC5988 Web Linking.  The
+        generator will request additional pages as needed until all items have
+        been returned.
+
+        Args:
+            url(basestring): The URL of the API endpoint.
+            params(dict): The parameters for the HTTP GET request.
+            **kwargs:
+                erc(int): The expected (success) response code for the request.
+                others: Passed on to the aiohttp or httpx package.
+
+        Raises:
+            ApiError: If anything other than the expected response code is
+                returned by the Webex Teams API endpoint.
+            MalformedResponse: If the returned response does not contain a
+                top-level dictionary with an "items" key.
+
+        """
+        async for json_page in self.get_pages(url, params=params, **kwargs):
+            assert isinstance(json_page, dict)
+
+            items = json_page.get("items")
+
+            if items is None:
+                error_message = "'items' key not found in JSON data: {!r}"
+                raise MalformedResponse(error_message.format(json_page))
+
+            else:
+                for item in items:
+                    yield item
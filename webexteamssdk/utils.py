@@ -42,7 +42,7 @@ import sys
 import urllib.parse
 import warnings
 from builtins import *
-from collections import OrderedDict, namedtuple
+from collections import namedtuple
 from datetime import datetime, timedelta, tzinfo
 
 from past.builtins import basestring
@@ -54,6 +54,11 @@ from .exceptions import (
 )
 from .response_codes import RATE_LIMIT_RESPONSE_CODE
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 EncodableFile = namedtuple(
     "EncodableFile", ["file_name", "file_object", "content_type"]
 )
@@ -169,6 +174,27 @@ def check_type(obj, acceptable_types, optional=False):
         raise TypeError(error_message)
 
 
+def check_types(*specs):
+    """Check several objects against their acceptable types in one call.
+
+    Equivalent to calling check_type() for each specification, with the
+    common case of every object being valid handled in a single loop.
+
+    Args:
+        *specs(tuple): (obj, acceptable_types, optional) tuples, as accepted
+            by check_type().
+
+    Raises:
+        TypeError: If an object is not an instance of one of its acceptable
+            types, or if it is None and optional=False.
+
+    """
+    for obj, acceptable_types, optional in specs:
+        if isinstance(obj, acceptable_types) or (optional and obj is None):
+            continue
+        check_type(obj, acceptable_types, optional=optional)
+
+
 def dict_from_items_with_values(*dictionaries, **items):
     """Creates a dict with the inputted items; pruning any that are `None`.
 
@@ -230,6 +256,10 @@ def check_response_code(response, expected_response_code):
 def extract_and_parse_json(response):
     """Extract and parse the JSON data from an requests.response object.
 
+    The raw response body is parsed with the much faster orjson package when
+    it is installed, and with the json module otherwise; both return JSON
+    objects as plain (insertion-ordered) dictionaries.
+
     Args:
         response(requests.response): The response object returned by a request
             using the requests package.
@@ -238,7 +268,10 @@ def extract_and_parse_json(response):
         The parsed JSON data as the appropriate native Python data type.
 
     """
-    return json.loads(response.text, object_hook=OrderedDict)
+    if orjson is not None:
+        return orjson.loads(response.content)
+    else:
+        return json.loads(response.text)
 
 
 def json_dict(json_data):
@@ -257,7 +290,7 @@ def json_dict(json_data):
     if isinstance(json_data, dict):
         return json_data
     elif isinstance(json_data, basestring):
-        return json.loads(json_data, object_hook=OrderedDict)
+        return json.loads(json_data)
     else:
         raise TypeError(
             "'json_data' must be a dictionary or valid JSON string; "